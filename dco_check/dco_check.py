@@ -15,17 +15,36 @@
 """Check that all commits for a proposed change are signed off."""
 
 import argparse
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.message import Message
+from functools import lru_cache
+import gzip
+import http.client
+import io
+import itertools
 import json
+from operator import itemgetter
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Type
+from typing import Union
+from urllib import error
 from urllib import request
 
 
@@ -42,7 +61,33 @@ ENV_VAR_EXCLUDE_EMAILS = 'DCO_CHECK_EXCLUDE_EMAILS'
 ENV_VAR_EXCLUDE_PATTERN = 'DCO_CHECK_EXCLUDE_PATTERN'
 ENV_VAR_QUIET = 'DCO_CHECK_QUIET'
 ENV_VAR_VERBOSE = 'DCO_CHECK_VERBOSE'
+# Maximum number of commits per page for GitHub API requests
+GITHUB_COMMITS_PER_PAGE = 100
+# Maximum number of concurrent GitHub API requests
+GITHUB_MAX_CONCURRENT_REQUESTS = 4
+# Resolve the git executable path once, instead of on every command
+GIT_EXECUTABLE = shutil.which('git') or 'git'
+PATTERN_REMOTE_HEAD_BRANCH = re.compile(r'  HEAD branch: (.*)')
+PATTERN_VALID_EMAIL = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+# Timeout for network requests, in seconds
+REQUEST_TIMEOUT = 30
 TRAILER_KEY_SIGNED_OFF_BY = 'Signed-off-by:'
+# Value of each sign-off trailer line in a commit message body
+PATTERN_SIGN_OFF = re.compile(
+    r'^' + re.escape(TRAILER_KEY_SIGNED_OFF_BY) + r' *(.*?)\s*$',
+    re.MULTILINE,
+)
+# Default option values, i.e. without any arguments or env vars, also used by the parser
+DEFAULT_OPTIONS: Dict[str, Any] = {
+    'check_merge_commits': False,
+    'default_branch': DEFAULT_BRANCH,
+    'default_branch_from_remote': False,
+    'default_remote': DEFAULT_REMOTE,
+    'exclude_emails': None,
+    'exclude_pattern': None,
+    'quiet': False,
+    'verbose': False,
+}
 
 
 class EnvDefaultOption(argparse.Action):
@@ -130,7 +175,7 @@ def get_parser() -> argparse.ArgumentParser:
     default_branch_group.add_argument(
         '-b', '--default-branch', metavar='BRANCH',
         action=EnvDefaultOption, env_var=ENV_VAR_DEFAULT_BRANCH,
-        default=DEFAULT_BRANCH,
+        default=DEFAULT_OPTIONS['default_branch'],
         help=(
             'default branch to use, if necessary (default: %(default)s)'
         ),
@@ -138,7 +183,7 @@ def get_parser() -> argparse.ArgumentParser:
     default_branch_group.add_argument(
         '--default-branch-from-remote',
         action=EnvDefaultStoreTrue, env_var=ENV_VAR_DEFAULT_BRANCH_FROM_REMOTE,
-        default=False,
+        default=DEFAULT_OPTIONS['default_branch_from_remote'],
         help=(
             'get the default branch value from the remote (default: %(default)s)'
         ),
@@ -146,7 +191,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-m', '--check-merge-commits',
         action=EnvDefaultStoreTrue, env_var=ENV_VAR_CHECK_MERGE_COMMITS,
-        default=False,
+        default=DEFAULT_OPTIONS['check_merge_commits'],
         help=(
             'check sign-offs on merge commits as well (default: %(default)s)'
         ),
@@ -154,7 +199,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-r', '--default-remote', metavar='REMOTE',
         action=EnvDefaultOption, env_var=ENV_VAR_DEFAULT_REMOTE,
-        default=DEFAULT_REMOTE,
+        default=DEFAULT_OPTIONS['default_remote'],
         help=(
             'default remote to use, if necessary (default: %(default)s)'
         ),
@@ -162,7 +207,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-e', '--exclude-emails', metavar='EMAIL[,EMAIL]',
         action=EnvDefaultOption, env_var=ENV_VAR_EXCLUDE_EMAILS,
-        default=None,
+        default=DEFAULT_OPTIONS['exclude_emails'],
         help=(
             'exclude a comma-separated list of author emails from checks '
             '(commits with an author email matching one of these emails will be ignored)'
@@ -171,7 +216,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '-p', '--exclude-pattern', metavar='REGEX',
         action=EnvDefaultOption, env_var=ENV_VAR_EXCLUDE_PATTERN,
-        default=None,
+        default=DEFAULT_OPTIONS['exclude_pattern'],
         help=(
             'exclude regular expresssion matched author emails from checks '
             '(commits with an author email matching regular expression pattern will be ignored)'
@@ -181,7 +226,7 @@ def get_parser() -> argparse.ArgumentParser:
     output_options_group.add_argument(
         '-q', '--quiet',
         action=EnvDefaultStoreTrue, env_var=ENV_VAR_QUIET,
-        default=False,
+        default=DEFAULT_OPTIONS['quiet'],
         help=(
             'quiet mode (do not print anything; simply exit with 0 or non-zero) '
             '(default: %(default)s)'
@@ -190,7 +235,7 @@ def get_parser() -> argparse.ArgumentParser:
     output_options_group.add_argument(
         '-v', '--verbose',
         action=EnvDefaultStoreTrue, env_var=ENV_VAR_VERBOSE,
-        default=False,
+        default=DEFAULT_OPTIONS['verbose'],
         help=(
             'verbose mode (print out more information) (default: %(default)s)'
         ),
@@ -217,16 +262,16 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 class Options:
     """Simple container and utilities for options."""
 
-    def __init__(self, parser: argparse.ArgumentParser) -> None:
-        """Create using default argument values."""
-        self.check_merge_commits = parser.get_default('m')
-        self.default_branch = parser.get_default('b')
-        self.default_branch_from_remote = parser.get_default('default-branch-from-remote')
-        self.default_remote = parser.get_default('r')
-        self.exclude_emails = parser.get_default('e')
-        self.exclude_pattern = parser.get_default('p')
-        self.quiet = parser.get_default('q')
-        self.verbose = parser.get_default('v')
+    def __init__(self) -> None:
+        """Create using default option values."""
+        self.check_merge_commits = DEFAULT_OPTIONS['check_merge_commits']
+        self.default_branch = DEFAULT_OPTIONS['default_branch']
+        self.default_branch_from_remote = DEFAULT_OPTIONS['default_branch_from_remote']
+        self.default_remote = DEFAULT_OPTIONS['default_remote']
+        self.exclude_emails = DEFAULT_OPTIONS['exclude_emails']
+        self.exclude_pattern = DEFAULT_OPTIONS['exclude_pattern']
+        self.quiet = DEFAULT_OPTIONS['quiet']
+        self.verbose = DEFAULT_OPTIONS['verbose']
 
     def set_options(self, args: argparse.Namespace) -> None:
         """Set options using parsed arguments."""
@@ -262,62 +307,116 @@ class Options:
         return self.__dict__
 
 
-options = Options(get_parser())
+options = Options()
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Do nothing."""
 
 
 class Logger:
-    """Simple logger to stdout which can be quiet or verbose."""
+    """
+    Simple logger to stdout which can be quiet or verbose.
+
+    The print functions are rebound to no-ops when they should not print anything.
+    """
 
-    def __init__(self, parser: argparse.ArgumentParser) -> None:
-        """Create using default argument values."""
-        self.__quiet = parser.get_default('q')
-        self.__verbose = parser.get_default('v')
+    def __init__(self) -> None:
+        """Create using default option values."""
+        self.__quiet = DEFAULT_OPTIONS['quiet']
+        self.__verbose = DEFAULT_OPTIONS['verbose']
+        self.__file: Optional[io.StringIO] = None
+        self.print: Callable[..., None] = _noop
+        self.verbose_print: Callable[..., None] = _noop
+        self.__bind_print_functions()
 
     def set_options(self, options: Options) -> None:
         """Set options using options object."""
         self.__quiet = options.quiet
         self.__verbose = options.verbose
+        self.__bind_print_functions()
 
-    def print(self, msg: str = '', *args: Any, **kwargs: Any) -> None:  # noqa: A003
-        """Print if not quiet."""
-        if not self.__quiet:
-            print(msg, *args, **kwargs)
+    def __bind_print_functions(self) -> None:
+        """Bind print() and verbose_print() to the actual printer or to a no-op."""
+        self.print = _noop if self.__quiet else self.__print
+        self.verbose_print = self.__print if self.__verbose else _noop
 
-    def verbose_print(self, msg: str = '', *args: Any, **kwargs: Any) -> None:
-        """Print if verbose."""
-        if self.__verbose:
-            print(msg, *args, **kwargs)
+    def is_quiet(self) -> bool:
+        """Check if quiet, i.e. if print() does not print anything."""
+        return bool(self.__quiet)
 
+    def is_verbose(self) -> bool:
+        """Check if verbose, i.e. if verbose_print() prints."""
+        return bool(self.__verbose)
 
-logger = Logger(get_parser())
+    def __print(self, msg: str = '', *args: Any, **kwargs: Any) -> None:
+        """Print to stdout, or to the current buffer."""
+        print(msg, *args, file=self.__file, **kwargs)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Buffer output and write it to stdout all at once when exiting the context.
+
+        This avoids writing to stdout for every single print call.
+        """
+        buffer = io.StringIO()
+        self.__file = buffer
+        try:
+            yield
+        finally:
+            self.__file = None
+            output = buffer.getvalue()
+            if output:
+                sys.stdout.write(output)
+
+
+logger = Logger()
+
+
+def get_command_env() -> Dict[str, str]:
+    """
+    Get the environment to use for running commands.
+
+    This removes locale-related environment variables to get non-localized output.
+
+    :return: the environment
+    """
+    env = os.environ.copy()
+    if 'LANG' in env:
+        del env['LANG']
+    for key in list(env.keys()):
+        if key.startswith('LC_'):
+            del env[key]
+    return env
 
 
 def run(
     command: List[str],
+    print_error: bool = True,
 ) -> Optional[str]:
     """
     Run command.
 
     :param command: the command list
+    :param print_error: whether to print the error output if the return code is not 0
     :return: the stdout output if the return code is 0, otherwise `None`
     """
     output = None
     try:
-        env = os.environ.copy()
-        if 'LANG' in env:
-            del env['LANG']
-        for key in list(env.keys()):
-            if key.startswith('LC_'):
-                del env[key]
         process = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            env=env,
+            env=get_command_env(),
+            # Allows using posix_spawn() instead of fork() + exec() on POSIX; not on Windows,
+            # where the child would then inherit all inheritable handles, e.g., other pipes
+            close_fds=(os.name == 'nt'),
         )
         output_stdout, _ = process.communicate()
         if process.returncode != 0:
-            logger.print(f'error: {output_stdout.decode("utf8")}')
+            if print_error:
+                logger.print(f'error: {output_stdout.decode("utf8")}')
         else:
             output = output_stdout.rstrip().decode('utf8').strip('\n')
     except subprocess.CalledProcessError as e:
@@ -325,36 +424,85 @@ def run(
     return output
 
 
+def run_streaming(
+    command: List[str],
+    record_sep: str = '\x1e',
+) -> Iterator[str]:
+    """
+    Run command and stream its stdout output as individual records.
+
+    Records are yielded as soon as they are fully read, without waiting for the command to end.
+    Leading/trailing newlines are removed from records, and empty records are skipped.
+    If the return code is not 0, the error output is printed.
+
+    :param command: the command list
+    :param record_sep: the string which separates individual records
+    :return: an iterator over the records
+    """
+    # Send stderr to a file so that the command cannot block on a full stderr pipe
+    with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        env=get_command_env(),
+        # Allows using posix_spawn() instead of fork() + exec() on POSIX; not on Windows,
+        # where the child would then inherit all inheritable handles, e.g., other pipes
+        close_fds=(os.name == 'nt'),
+    ) as process:
+        assert process.stdout is not None
+        # Decode incrementally while reading
+        stdout = io.TextIOWrapper(process.stdout, encoding='utf8', newline='')
+        pending = ''
+        for output_line in stdout:
+            pending += output_line
+            if record_sep not in output_line:
+                continue
+            # Keep the trailing partial record for later
+            full_records, _, pending = pending.rpartition(record_sep)
+            yield from split_commits_data(full_records, record_sep)
+        yield from split_commits_data(pending, record_sep)
+        process.wait()
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            logger.print(f'error: {stderr_file.read().decode("utf8")}')
+
+
 def is_valid_email(
     email: str,
 ) -> bool:
     """
     Check if email is valid.
 
-    Simple regex checking for:
-        <nonwhitespace string>@<nonwhitespace string>.<nonwhitespace string>
+    Simple regex checking that the whole email is:
+        <string>@<string>.<string>
+    where each string is non-empty and does not contain whitespace or '@'.
 
     :param email: the email address to check
     :return: true if email is valid, false otherwise
     """
-    return bool(re.match(r'^\S+@\S+\.\S+', email))
+    return bool(PATTERN_VALID_EMAIL.fullmatch(email))
 
 
-def get_head_commit_hash() -> Optional[str]:
+@lru_cache(maxsize=None)
+def get_head_commit_hash(
+    print_error: bool = True,
+) -> Optional[str]:
     """
     Get the hash of the HEAD commit.
 
+    :param print_error: whether to print the error output if it failed
     :return: the hash of the HEAD commit, or `None` if it failed
     """
     command = [
-        'git',
+        GIT_EXECUTABLE,
         'rev-parse',
         '--verify',
         'HEAD',
     ]
-    return run(command)
+    return run(command, print_error=print_error)
 
 
+@lru_cache(maxsize=None)
 def get_common_ancestor_commit_hash(
     base_ref: str,
 ) -> Optional[str]:
@@ -367,7 +515,7 @@ def get_common_ancestor_commit_hash(
     :return: the common ancestor commit, or `None` if it failed
     """
     command = [
-        'git',
+        GIT_EXECUTABLE,
         'merge-base',
         '--fork-point',
         base_ref,
@@ -375,6 +523,18 @@ def get_common_ancestor_commit_hash(
     return run(command)
 
 
+def clear_git_caches() -> None:
+    """
+    Clear cached results of git commands.
+
+    Within a single run, repeated calls to get_head_commit_hash() and
+    get_common_ancestor_commit_hash() return cached values.
+    This needs to be called if the repository changes, e.g. after fetching.
+    """
+    get_head_commit_hash.cache_clear()
+    get_common_ancestor_commit_hash.cache_clear()
+
+
 def fetch_branch(
     branch: str,
     remote: str = 'origin',
@@ -389,13 +549,37 @@ def fetch_branch(
     :return: zero for success, nonzero otherwise
     """
     command = [
-        'git',
+        GIT_EXECUTABLE,
         'fetch',
+        # Only output errors
+        '--quiet',
         remote,
         branch,
     ]
     # We don't want the output
-    return 0 if run(command) is not None else 1
+    if run(command) is None:
+        return 1
+    # Fetching can change the result of some git commands
+    clear_git_caches()
+    return 0
+
+
+def get_fork_point_from_remote(
+    branch: str,
+    remote: str,
+) -> Optional[str]:
+    """
+    Fetch a branch from a remote and get the fork point off of the remote branch.
+
+    :param branch: the name of the branch
+    :param remote: the name of the remote
+    :return: the common ancestor commit, or `None` if it failed
+    """
+    if 0 != fetch_branch(branch, remote):
+        logger.print(f"failed to fetch '{branch}' from remote '{remote}'")
+        return None
+    remote_branch_ref = remote + '/' + branch
+    return get_common_ancestor_commit_hash(remote_branch_ref)
 
 
 def get_default_branch_from_remote(
@@ -409,7 +593,7 @@ def get_default_branch_from_remote(
     """
     # https://stackoverflow.com/questions/28666357/git-how-to-get-default-branch#comment92366240_50056710  # noqa: E501
     #   $ git remote show origin
-    cmd = ['git', 'remote', 'show', remote]
+    cmd = [GIT_EXECUTABLE, 'remote', 'show', remote]
     result = run(cmd)
     if not result:
         return None
@@ -417,7 +601,7 @@ def get_default_branch_from_remote(
     branch = None
     for result_line in result_lines:
         # There is a two-space indentation
-        match = re.match('  HEAD branch: (.*)', result_line)
+        match = PATTERN_REMOTE_HEAD_BRANCH.match(result_line)
         if match:
             branch = match[1]
             break
@@ -428,32 +612,32 @@ def get_commits_data(
     base: str,
     head: str,
     ignore_merge_commits: bool = True,
-) -> Optional[str]:
+) -> Iterator[str]:
     """
     Get data (full sha & commit body) for commits in a range.
 
     The range excludes the 'before' commit, e.g. ]base, head]
-    The output data contains data for individual commits, separated by special characters:
+    The data is streamed from the git output, one commit at a time.
+    The data for each individual commit contains:
        * 1st line: full commit sha
        * 2nd line: author name and email
        * 3rd line: commit title (subject)
        * subsequent lines: commit body (which excludes the commit title line)
-       * record separator (0x1e)
 
     :param base: the sha of the commit just before the start of the range
     :param head: the sha of the last commit of the range
     :param ignore_merge_commits: whether to ignore merge commits
-    :return: the data, or `None` if it failed
+    :return: an iterator over the data of individual commits
     """
     command = [
-        'git',
+        GIT_EXECUTABLE,
         'log',
         f'{base}..{head}',
         '--pretty=%H%n%an <%ae>%n%s%n%-b%x1e',
     ]
     if ignore_merge_commits:
         command += ['--no-merges']
-    return run(command)
+    return run_streaming(command)
 
 
 def split_commits_data(
@@ -467,15 +651,14 @@ def split_commits_data(
     :param commits_sep: the string which separates individual commits
     :return: the list of data for each individual commit
     """
-    # Remove leading/trailing newlines
-    commits_data = commits_data.strip('\n')
-    # Split in individual commits and remove leading/trailing newlines
-    individual_commits = [
-        single_output.strip('\n') for single_output in commits_data.split(commits_sep)
+    # Split in individual commits, remove leading/trailing newlines, and filter out empty elements
+    return [
+        individual_commit
+        for individual_commit in (
+            single_output.strip('\n') for single_output in commits_data.split(commits_sep)
+        )
+        if individual_commit
     ]
-    # Filter out empty elements
-    individual_commits = list(filter(None, individual_commits))
-    return individual_commits
 
 
 def extract_name_and_email(
@@ -487,10 +670,17 @@ def extract_name_and_email(
     :param name_and_email: the name and email string
     :return: the extracted (name, email) tuple, or `None` if it failed
     """
-    match = re.search('(.*) <(.*)>', name_and_email)
-    if not match:
+    # Plain string operations are cheaper than a regex here
+    # The email is between the last ' <' and the following '>', and any text after it is ignored
+    email_start = name_and_email.rfind(' <')
+    email_end = name_and_email.find('>', email_start + 2)
+    if email_start < 0 or email_end < 0:
         return None
-    return match.group(1), match.group(2)
+    name = name_and_email[:email_start].strip()
+    email = name_and_email[email_start + 2:email_end]
+    if not name or not email:
+        return None
+    return name, email
 
 
 def format_name_and_email(
@@ -522,6 +712,8 @@ def get_env_var(
     """
     value = os.environ.get(env_var, None)
     if value is None:
+        # Do not bother building messages that will not be printed
+        print_if_not_found = print_if_not_found and not logger.is_quiet()
         if default is not None:
             if print_if_not_found:
                 logger.print(
@@ -534,25 +726,41 @@ def get_env_var(
     return value
 
 
-class CommitInfo:
+class _CommitInfoFields(NamedTuple):
+    """Fields of CommitInfo."""
+
+    hash: str  # noqa: A003
+    title: str
+    body: str
+    author_name: Optional[str]
+    author_email: Optional[str]
+    is_merge_commit: bool
+
+
+class CommitInfo(_CommitInfoFields):
     """Container for all necessary commit information."""
 
-    def __init__(
-        self,
+    __slots__ = ()
+
+    def __new__(
+        cls,
         commit_hash: str,
         title: str,
-        body: List[str],
+        body: str,
         author_name: Optional[str],
         author_email: Optional[str],
         is_merge_commit: bool = False,
-    ) -> None:
+    ) -> 'CommitInfo':
         """Create a CommitInfo object."""
-        self.hash = commit_hash
-        self.title = title
-        self.body = body
-        self.author_name = author_name
-        self.author_email = author_email
-        self.is_merge_commit = is_merge_commit
+        return super().__new__(
+            cls,
+            commit_hash,
+            title,
+            body,
+            author_name,
+            author_email,
+            is_merge_commit,
+        )
 
 
 class CommitDataRetriever:
@@ -600,12 +808,20 @@ class GitRetriever(CommitDataRetriever):
     def get_commit_range(self) -> Optional[Tuple[str, str]]:  # noqa: D102
         default_branch = options.default_branch
         logger.verbose_print(f"\tusing default branch '{default_branch}'")
-        commit_hash_base = get_common_ancestor_commit_hash(default_branch)
+        # These are independent, so run them concurrently, but only report an error for HEAD
+        # if getting the common ancestor did not already fail
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_base = executor.submit(get_common_ancestor_commit_hash, default_branch)
+            future_head = executor.submit(get_head_commit_hash, print_error=False)
+            commit_hash_base = future_base.result()
+            commit_hash_head = future_head.result()
         if not commit_hash_base:
             return None
-        commit_hash_head = get_head_commit_hash()
         if not commit_hash_head:
-            return None
+            # Run it again to report the error
+            commit_hash_head = get_head_commit_hash()
+            if not commit_hash_head:
+                return None
         return commit_hash_base, commit_hash_head
 
     def get_commits(  # noqa: D102
@@ -618,19 +834,17 @@ class GitRetriever(CommitDataRetriever):
         ignore_merge_commits = not check_merge_commits
         commits_data = get_commits_data(base, head, ignore_merge_commits=ignore_merge_commits)
         commits: List[CommitInfo] = []
-        if commits_data is None:
-            return commits
-        individual_commits = split_commits_data(commits_data)
-        for commit_data in individual_commits:
-            commit_lines = commit_data.split('\n')
-            commit_hash = commit_lines[0]
-            commit_author_data = commit_lines[1]
-            commit_title = commit_lines[2]
-            commit_body = commit_lines[3:]
+        for commit_data in commits_data:
+            # Peel off the first lines and keep the rest as the body
+            commit_hash, _, commit_data = commit_data.partition('\n')
+            commit_author_data, _, commit_data = commit_data.partition('\n')
+            # Skip empty lines before the title
+            commit_title, _, commit_body = commit_data.lstrip('\n').partition('\n')
             author_result = extract_name_and_email(commit_author_data)
             author_name, author_email = None, None
             if author_result:
-                author_name, author_email = author_result
+                # Most commits usually share the same author, so avoid keeping duplicate strings
+                author_name, author_email = map(sys.intern, author_result)
             # There won't be any merge commits at this point
             is_merge_commit = False
             commits.append(
@@ -715,14 +929,8 @@ class GitLabRetriever(GitRetriever):
                 f"\ton branch '{current_branch}': "
                 f"will check forked commits off of default branch '{default_branch}'"
             )
-            # Fetch default branch
-            remote = options.default_remote
-            if 0 != fetch_branch(default_branch, remote):
-                logger.print(f"failed to fetch '{default_branch}' from remote '{remote}'")
-                return None
-            # Use remote default branch ref
-            remote_branch_ref = remote + '/' + default_branch
-            commit_hash_base = get_common_ancestor_commit_hash(remote_branch_ref)
+            # Fetch default branch and use remote default branch ref
+            commit_hash_base = get_fork_point_from_remote(default_branch, options.default_remote)
             if not commit_hash_base:
                 return None
             return commit_hash_base, commit_hash_head
@@ -768,14 +976,8 @@ class CircleCiRetriever(GitRetriever):
                 f"\ton branch '{current_branch}': "
                 f"will check forked commits off of default branch '{default_branch}'"
             )
-            # Fetch default branch
-            remote = options.default_remote
-            if 0 != fetch_branch(default_branch, remote):
-                logger.print(f"failed to fetch '{default_branch}' from remote '{remote}'")
-                return None
-            # Use remote default branch ref
-            remote_branch_ref = remote + '/' + default_branch
-            commit_hash_base = get_common_ancestor_commit_hash(remote_branch_ref)
+            # Fetch default branch and use remote default branch ref
+            commit_hash_base = get_fork_point_from_remote(default_branch, options.default_remote)
             if not commit_hash_base:
                 return None
             return commit_hash_base, commit_hash_head
@@ -823,15 +1025,9 @@ class AzurePipelinesRetriever(GitRetriever):
                 f"will check forked commits off of default branch '{default_branch}'"
             )
             base_branch = default_branch
-        # Fetch base branch
+        # Fetch base branch and use remote base branch ref
         assert base_branch
-        remote = options.default_remote
-        if 0 != fetch_branch(base_branch, remote):
-            logger.print(f"failed to fetch '{base_branch}' from remote '{remote}'")
-            return None
-        # Use remote default branch ref
-        remote_branch_ref = remote + '/' + base_branch
-        commit_hash_base = get_common_ancestor_commit_hash(remote_branch_ref)
+        commit_hash_base = get_fork_point_from_remote(base_branch, options.default_remote)
         if not commit_hash_base:
             return None
         return commit_hash_base, commit_hash_head
@@ -890,6 +1086,22 @@ class AppVeyorRetriever(GitRetriever):
             return commit_hash_base, commit_hash_head
 
 
+def get_response_body(
+    response: IO[bytes],
+    headers: Message,
+) -> Union[IO[bytes], gzip.GzipFile]:
+    """
+    Get the body of an HTTP response, decompressing it if needed.
+
+    :param response: the response
+    :param headers: the response headers
+    :return: the response body
+    """
+    if headers.get('Content-Encoding') == 'gzip':
+        return gzip.GzipFile(fileobj=response)
+    return response
+
+
 class GitHubRetriever(CommitDataRetriever):
     """Implementation for GitHub CI."""
 
@@ -911,9 +1123,8 @@ class GitHubRetriever(CommitDataRetriever):
         event_payload_path = get_env_var('GITHUB_EVENT_PATH')
         if not event_payload_path:
             return None
-        f = open(event_payload_path)
-        self.event_payload = json.load(f)
-        f.close()
+        with open(event_payload_path, 'rb') as f:
+            self.event_payload = json.load(f)
 
         # Get base & head commits depending on the workflow event type
         event_name = get_env_var('GITHUB_EVENT_NAME')
@@ -960,134 +1171,217 @@ class GitHubRetriever(CommitDataRetriever):
             return None
         return commit_hash_base, commit_hash_head
 
+    def request_json(self, url: str) -> Optional[Any]:
+        """
+        Send a GET request to the GitHub API and decode the JSON response.
+
+        :param url: the URL
+        :return: the decoded JSON response, or `None` if it failed
+        """
+        req = request.Request(url, headers={
+            'User-Agent': 'dco_check',
+            'Authorization': 'token ' + (self.github_token or ''),
+            # Request a compressed response, which is much smaller
+            'Accept-Encoding': 'gzip',
+        })
+        try:
+            # Do not hang forever if the API does not respond
+            with request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+                return json.load(get_response_body(response, response.headers))
+        except error.HTTPError as e:
+            # Only print the beginning of the response
+            response_start = get_response_body(e, e.headers).read(1024)
+            logger.print(f'Request failed: {url}', e.code)
+            logger.print('response:', response_start.decode('utf8', errors='replace'))
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            # Network errors, timeouts, incomplete responses, and invalid JSON or gzip data
+            logger.print(f'Request failed: {url}', repr(e))
+        return None
+
     def get_commits(  # noqa: D102
         self,
         base: str,
         head: str,
+        check_merge_commits: bool = False,
         **kwargs: Any,
     ) -> Optional[List[CommitInfo]]:
-        # Request commit data
         compare_url_template = self.event_payload['repository']['compare_url']
         compare_url = compare_url_template.format(base=base, head=head)
-        req = request.Request(compare_url, headers={
-            'User-Agent': 'dco_check',
-            'Authorization': 'token ' + (self.github_token or ''),
-        })
-        response = request.urlopen(req)
-        if 200 != response.getcode():  # pragma: no cover
-            from pprint import pformat
-            logger.print('Request failed: compare_url')
-            logger.print('reponse:', pformat(response.read().decode()))
+        # Request commit data in pages, since the number of commits per response is limited
+        page_urls = (
+            f'{compare_url}?per_page={GITHUB_COMMITS_PER_PAGE}&page={page}'
+            for page in itertools.count(1)
+        )
+        first_page_json = self.request_json(next(page_urls))
+        if first_page_json is None:
             return None
+        pages_json = [first_page_json]
+        # Use the total number of commits to request all other pages concurrently
+        total_commits = first_page_json.get('total_commits', len(first_page_json['commits']))
+        num_pages = -(-total_commits // GITHUB_COMMITS_PER_PAGE)
+        if num_pages > 1:
+            with ThreadPoolExecutor(max_workers=GITHUB_MAX_CONCURRENT_REQUESTS) as executor:
+                pages_json.extend(
+                    executor.map(self.request_json, itertools.islice(page_urls, num_pages - 1))
+                )
 
         # Extract data
-        response_json = json.load(response)
+        get_sha = itemgetter('sha')
+        get_commit = itemgetter('commit')
+        get_parents = itemgetter('parents')
+        get_author = itemgetter('author')
+        get_message = itemgetter('message')
+        get_name_and_email = itemgetter('name', 'email')
         commits = []
-        for commit in response_json['commits']:
-            commit_hash = commit['sha']
-            message = commit['commit']['message'].split('\n')
-            message = list(filter(None, message))
-            commit_title = message[0]
-            commit_body = message[1:]
-            author_name = commit['commit']['author']['name']
-            author_email = commit['commit']['author']['email']
-            is_merge_commit = len(commit['parents']) > 1
-            commits.append(
-                CommitInfo(
-                    commit_hash,
-                    commit_title,
-                    commit_body,
-                    author_name,
-                    author_email,
-                    is_merge_commit,
+        for page_json in pages_json:
+            if page_json is None:
+                return None
+            for commit in page_json['commits']:
+                is_merge_commit = len(get_parents(commit)) > 1
+                # Skip merge commits right away if they will not be checked
+                if is_merge_commit and not check_merge_commits:
+                    continue
+                commit_hash = get_sha(commit)
+                commit_data = get_commit(commit)
+                # Split title from the rest and keep the body as a single string
+                commit_title, _, message_body = get_message(commit_data).partition('\n')
+                commit_body = message_body.strip('\n')
+                author_name, author_email = get_name_and_email(get_author(commit_data))
+                # Most commits usually share the same author, so avoid keeping duplicate strings
+                if isinstance(author_name, str):
+                    author_name = sys.intern(author_name)
+                if isinstance(author_email, str):
+                    author_email = sys.intern(author_email)
+                commits.append(
+                    CommitInfo(
+                        commit_hash,
+                        commit_title,
+                        commit_body,
+                        author_name,
+                        author_email,
+                        is_merge_commit,
+                    )
                 )
-            )
         return commits
 
 
-def process_commits(
-    commits: List[CommitInfo],
+# Retrievers in order of priority
+# The applies() checks are cheap environment variable lookups, except the default one which
+# always applies, so they can simply be checked one after the other until one applies
+RETRIEVERS: Tuple[Type[CommitDataRetriever], ...] = (
+    GitLabRetriever,
+    GitHubRetriever,
+    AzurePipelinesRetriever,
+    AppVeyorRetriever,
+    CircleCiRetriever,
+    GitRetriever,
+)
+
+
+def check_commit(
+    commit: CommitInfo,
     check_merge_commits: bool,
-) -> Dict[str, List[str]]:
+) -> List[str]:
     """
-    Process commit information to detect DCO infractions.
+    Check a single commit for DCO infractions.
 
-    :param commits: the list of commit info
+    :param commit: the commit info
     :param check_merge_commits: true to check merge commits, false otherwise
-    :return: the infractions as a dict {commit sha, infraction explanation}
+    :return: the infractions for the commit, which is empty if there are none or if it is ignored
     """
-    infractions: Dict[str, List[str]] = defaultdict(list)
-    for commit in commits:
-        # Skip this commit if it is a merge commit and the
-        # option for checking merge commits is not enabled
-        if commit.is_merge_commit and not check_merge_commits:
-            logger.verbose_print('\t' + 'ignoring merge commit:', commit.hash)
-            logger.verbose_print()
-            continue
+    infractions: List[str] = []
+    # Skip this commit if it is a merge commit and the
+    # option for checking merge commits is not enabled
+    if commit.is_merge_commit and not check_merge_commits:
+        logger.verbose_print('\t' + 'ignoring merge commit:', commit.hash)
+        logger.verbose_print()
+        return infractions
 
+    # Avoid formatting commit information if it will not be printed
+    if logger.is_verbose():
         logger.verbose_print(
             '\t' + commit.hash + (' (merge commit)' if commit.is_merge_commit else '')
         )
-        logger.verbose_print('\t' + format_name_and_email(commit.author_name, commit.author_email))
+        logger.verbose_print(
+            '\t' + format_name_and_email(commit.author_name, commit.author_email)
+        )
         logger.verbose_print('\t' + commit.title)
-        logger.verbose_print('\t' + '\n\t'.join(commit.body))
+        logger.verbose_print('\t' + commit.body.replace('\n', '\n\t'))
 
-        # Check author name and email
-        if any(not d for d in [commit.author_name, commit.author_email]):
-            infractions[commit.hash].append(
-                f'could not extract author data for commit: {commit.hash}'
-            )
-            continue
+    # Check author name and email
+    if not commit.author_name or not commit.author_email:
+        infractions.append(f'could not extract author data for commit: {commit.hash}')
+        return infractions
+
+    # Check if the commit should be ignored because of the commit author email
+    if options.exclude_emails and commit.author_email in options.exclude_emails:
+        logger.verbose_print('\t\texcluding commit since author email is in exclude list')
+        logger.verbose_print()
+        return infractions
 
-        # Check if the commit should be ignored because of the commit author email
-        if options.exclude_emails and commit.author_email in options.exclude_emails:
-            logger.verbose_print('\t\texcluding commit since author email is in exclude list')
+    # Check if the commit should be ignored because of the commit author email pattern
+    if commit.author_email and options.exclude_pattern:
+        if options.exclude_pattern.search(commit.author_email):
+            logger.verbose_print('\t\texcluding commit since author email is matched by')
+            logger.verbose_print('\t\tpattern')
             logger.verbose_print()
-            continue
+            return infractions
 
-        # Check if the commit should be ignored because of the commit author email pattern
-        if commit.author_email and options.exclude_pattern:
-            if options.exclude_pattern.search(commit.author_email):
-                logger.verbose_print('\t\texcluding commit since author email is matched by')
-                logger.verbose_print('\t\tpattern')
-                logger.verbose_print()
-                continue
+    # Extract sign-off data
+    sign_offs = PATTERN_SIGN_OFF.findall(commit.body)
 
-        # Extract sign-off data
-        sign_offs = [
-            body_line.replace(TRAILER_KEY_SIGNED_OFF_BY, '').strip(' ')
-            for body_line in commit.body
-            if body_line.startswith(TRAILER_KEY_SIGNED_OFF_BY)
-        ]
+    # Check that there is at least one sign-off right away
+    if len(sign_offs) == 0:
+        infractions.append('no sign-off found')
+        return infractions
 
-        # Check that there is at least one sign-off right away
-        if len(sign_offs) == 0:
-            infractions[commit.hash].append('no sign-off found')
+    # Extract sign off information, normalizing emails for comparison
+    sign_offs_name_email: Set[Tuple[str, str]] = set()
+    for sign_off in sign_offs:
+        sign_off_result = extract_name_and_email(sign_off)
+        if not sign_off_result:
             continue
-
-        # Extract sign off information
-        sign_offs_name_email: List[Tuple[str, str]] = []
-        for sign_off in sign_offs:
-            sign_off_result = extract_name_and_email(sign_off)
-            if not sign_off_result:
-                continue
-            name, email = sign_off_result
+        name, email = sign_off_result
+        if logger.is_verbose():
             logger.verbose_print(f'\t\tfound sign-off: {format_name_and_email(name, email)}')
-            if not is_valid_email(email):
-                infractions[commit.hash].append(f'invalid email: {email}')
-            else:
-                sign_offs_name_email.append((name, email))
+        if not is_valid_email(email):
+            infractions.append(f'invalid email: {email}')
+        else:
+            sign_offs_name_email.add((name, email.strip().lower()))
+
+    # Check that author is in the sign-offs
+    author_name_email = (commit.author_name, commit.author_email.strip().lower())
+    if author_name_email not in sign_offs_name_email:
+        infractions.append(
+            'sign-off not found for commit author: '
+            f'{commit.author_name} {commit.author_email}; found: {sign_offs}'
+        )
 
-        # Check that author is in the sign-offs
-        if not (commit.author_name, commit.author_email) in sign_offs_name_email:
-            infractions[commit.hash].append(
-                'sign-off not found for commit author: '
-                f'{commit.author_name} {commit.author_email}; found: {sign_offs}'
-            )
+    # Separator between commits
+    logger.verbose_print()
+    return infractions
 
-        # Separator between commits
-        logger.verbose_print()
 
+def process_commits(
+    commits: Iterable[CommitInfo],
+    check_merge_commits: bool,
+) -> Dict[str, List[str]]:
+    """
+    Process commit information to detect DCO infractions.
+
+    :param commits: the commit info
+    :param check_merge_commits: true to check merge commits, false otherwise
+    :return: the infractions as a dict {commit sha, infraction explanation}
+    """
+    infractions: Dict[str, List[str]] = {}
+    # Use a local name to avoid a global lookup for every commit
+    check = check_commit
+    # Buffer output to write it all at once at the end
+    with logger.buffered():
+        for commit in commits:
+            commit_infractions = check(commit, check_merge_commits)
+            if commit_infractions:
+                infractions[commit.hash] = commit_infractions
     return infractions
 
 
@@ -1100,7 +1394,7 @@ def check_infractions(
     :param infractions: the infractions dict {commit sha, infraction explanation}
     :return: 0 if no infractions, non-zero otherwise
     """
-    if len(infractions) > 0:
+    if infractions:
         logger.print('Missing sign-off(s):')
         logger.print()
         for commit_sha, commit_infractions in infractions.items():
@@ -1123,6 +1417,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     options.set_options(args)
     logger.set_options(options)
 
+    # Do not reuse values cached by a previous run
+    clear_git_caches()
+
     # Print options
     if options.verbose:
         logger.verbose_print('Options:')
@@ -1132,16 +1429,8 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Detect CI
     # Use first one that applies
-    retrievers = [
-        GitLabRetriever,
-        GitHubRetriever,
-        AzurePipelinesRetriever,
-        AppVeyorRetriever,
-        CircleCiRetriever,
-        GitRetriever,
-    ]
     commit_retriever = None
-    for retriever_cls in retrievers:
+    for retriever_cls in RETRIEVERS:
         retriever = retriever_cls()
         if retriever.applies():
             commit_retriever = retriever
@@ -12,20 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import unittest
+import io
 import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
 
+from dco_check.dco_check import clear_git_caches
+from dco_check.dco_check import CommitInfo
 from dco_check.dco_check import get_default_branch_from_remote
+from dco_check.dco_check import GitRetriever
 from dco_check.dco_check import main
+from dco_check.dco_check import options
+from dco_check.dco_check import run_streaming
 
 
 class TestDcoCheck(unittest.TestCase):
 
-    def __init__(self, *args) -> None:
-        super().__init__(
-            *args,
-        )
-
     def test_main(self) -> None:
         if not os.path.exists('.git'):
             self.skipTest('tree is not a git checkout')
@@ -36,3 +40,96 @@ class TestDcoCheck(unittest.TestCase):
             self.skipTest('tree is not a git checkout')
         self.assertEqual('master', get_default_branch_from_remote('origin'))
         self.assertIsNone(get_default_branch_from_remote('this-remote-does-not-exist'))
+
+
+class TestGitRetriever(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Create a temporary repository with a few commits and run git commands from it
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+        self.git('init', '--quiet')
+        self.base = self.commit('Tinky Winky', 'tinky@winky.com', 'Initial commit')
+        self.commit(
+            'Tinky Winky',
+            'tinky@winky.com',
+            'Add feature\n\nSome description\n\nSigned-off-by: Tinky Winky <tinky@winky.com>',
+        )
+        self.head = self.commit('Laa-Laa', 'laa@laa.laa', 'Fix feature')
+
+    @staticmethod
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ['git', *args],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.strip()
+
+    def commit(self, name: str, email: str, message: str) -> str:
+        self.git(
+            '-c', f'user.name={name}',
+            '-c', f'user.email={email}',
+            '-c', 'commit.gpgsign=false',
+            'commit', '--quiet', '--allow-empty', '-m', message,
+        )
+        return self.git('rev-parse', 'HEAD')
+
+    def test_get_commits(self) -> None:
+        commits = GitRetriever().get_commits(self.base, self.head)
+        self.assertEqual(
+            [
+                CommitInfo(
+                    self.head,
+                    'Fix feature',
+                    '',
+                    'Laa-Laa',
+                    'laa@laa.laa',
+                    False,
+                ),
+                CommitInfo(
+                    self.git('rev-parse', 'HEAD~1'),
+                    'Add feature',
+                    'Some description\n\nSigned-off-by: Tinky Winky <tinky@winky.com>',
+                    'Tinky Winky',
+                    'tinky@winky.com',
+                    False,
+                ),
+            ],
+            commits,
+        )
+        self.assertEqual([], GitRetriever().get_commits(self.head, self.head))
+
+    def test_get_commits_empty_lines_before_title(self) -> None:
+        # Empty lines before the title are skipped
+        commit_data = 'abc\nPo <po@p.o>\n\n\nTitle\nSigned-off-by: Po <po@p.o>'
+        with patch('dco_check.dco_check.get_commits_data', return_value=iter([commit_data])):
+            self.assertEqual(
+                [CommitInfo('abc', 'Title', 'Signed-off-by: Po <po@p.o>', 'Po', 'po@p.o', False)],
+                GitRetriever().get_commits('base', 'head'),
+            )
+
+    def test_get_commit_range(self) -> None:
+        clear_git_caches()
+        self.addCleanup(clear_git_caches)
+        self.git('branch', 'main-branch', self.base)
+        with patch.object(options, 'default_branch', 'main-branch'):
+            self.assertEqual((self.base, self.head), GitRetriever().get_commit_range())
+
+        # Only one error is printed if both the common ancestor and HEAD cannot be found
+        clear_git_caches()
+        self.git('checkout', '--quiet', '--orphan', 'orphan-branch')
+        with patch.object(options, 'default_branch', 'does-not-exist'):
+            with patch('sys.stdout', new=io.StringIO()) as fake_stdout:
+                self.assertIsNone(GitRetriever().get_commit_range())
+                self.assertEqual(1, fake_stdout.getvalue().count('error:'))
+
+    def test_run_streaming(self) -> None:
+        self.assertEqual(
+            ['Fix feature', 'Add feature', 'Initial commit'],
+            list(run_streaming(['git', 'log', '--pretty=%s%x1e'])),
+        )
+        # Errors are printed and no records are yielded
+        self.assertEqual([], list(run_streaming(['git', 'log', 'this-ref-does-not-exist'])))
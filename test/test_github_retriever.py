@@ -0,0 +1,210 @@
+# Copyright 2020 Christophe Bedard
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from email.message import Message
+import gzip
+import http.client
+import io
+import json
+import socket
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+import unittest
+from unittest.mock import patch
+from urllib import error
+from urllib import parse
+from urllib import request
+
+from dco_check.dco_check import CommitInfo
+from dco_check.dco_check import GITHUB_COMMITS_PER_PAGE
+from dco_check.dco_check import GitHubRetriever
+
+
+def get_headers(gzipped: bool) -> Message:
+    headers = Message()
+    if gzipped:
+        headers['Content-Encoding'] = 'gzip'
+    return headers
+
+
+def get_body(data: Any, gzipped: bool) -> bytes:
+    # Raw bytes are used as-is, e.g., to serve invalid JSON
+    body = data if isinstance(data, bytes) else json.dumps(data).encode('utf8')
+    return gzip.compress(body) if gzipped else body
+
+
+class FakeResponse(io.BytesIO):
+
+    def __init__(self, data: Any, gzipped: bool = False) -> None:
+        super().__init__(get_body(data, gzipped))
+        self.headers = get_headers(gzipped)
+
+
+class TestGitHubRetriever(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patcher = patch('dco_check.dco_check.request.urlopen')
+        self.urlopen = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.retriever = GitHubRetriever()
+        self.retriever.github_token = 'token'
+        self.retriever.event_payload = {
+            'repository': {'compare_url': 'https://api.github.com/compare/{base}...{head}'},
+        }
+
+    def test_request_json(self) -> None:
+        for gzipped in (False, True):
+            with self.subTest(gzipped=gzipped):
+                self.urlopen.return_value = FakeResponse({'a': 1}, gzipped)
+                self.assertEqual({'a': 1}, self.retriever.request_json('https://url'))
+
+    def test_request_json_failure(self) -> None:
+        for gzipped in (False, True):
+            with self.subTest(gzipped=gzipped):
+                self.urlopen.side_effect = error.HTTPError(
+                    'https://url',
+                    404,
+                    'Not Found',
+                    get_headers(gzipped),
+                    io.BytesIO(get_body({'message': 'Not Found'}, gzipped)),
+                )
+                with patch('sys.stdout', new=io.StringIO()) as fake_stdout:
+                    self.assertIsNone(self.retriever.request_json('https://url'))
+                    # The response body is decompressed before being printed
+                    self.assertIn('404', fake_stdout.getvalue())
+                    self.assertIn('{"message": "Not Found"}', fake_stdout.getvalue())
+
+        for exception in (error.URLError('no network'), TimeoutError(), socket.timeout()):
+            with self.subTest(exception=exception):
+                self.urlopen.side_effect = exception
+                with patch('sys.stdout', new=io.StringIO()):
+                    self.assertIsNone(self.retriever.request_json('https://url'))
+
+    @staticmethod
+    def get_commit_json(sha: str, num_parents: int = 1) -> Any:
+        return {
+            'sha': sha,
+            'parents': [{'sha': 'parent'}] * num_parents,
+            'commit': {
+                'author': {'name': 'Po', 'email': 'po@p.o'},
+                'message': f'Title {sha}\n\nSigned-off-by: Po <po@p.o>\n',
+            },
+        }
+
+    def fake_compare_api(
+        self,
+        total_commits: int,
+        failed_page: int = 0,
+        failure: Union[Exception, bytes] = error.URLError('no network'),
+        include_total_commits: bool = True,
+    ) -> List[str]:
+        # Serve pages of commits, with a merge commit at the very end, and record requested URLs
+        # The failed page either raises the given exception or has the given invalid body
+        requested_urls = []
+
+        def urlopen(req: request.Request, timeout: float) -> FakeResponse:
+            requested_urls.append(req.full_url)
+            page = int(parse.parse_qs(parse.urlparse(req.full_url).query)['page'][0])
+            if page == failed_page:
+                if isinstance(failure, Exception):
+                    raise failure
+                return FakeResponse(failure)
+            first = (page - 1) * GITHUB_COMMITS_PER_PAGE
+            last = min(page * GITHUB_COMMITS_PER_PAGE, total_commits)
+            commits = [
+                self.get_commit_json(str(i), 2 if i == total_commits - 1 else 1)
+                for i in range(first, last)
+            ]
+            # Also exercise gzip decoding
+            page_json: Dict[str, Any] = {'commits': commits}
+            if include_total_commits:
+                page_json['total_commits'] = total_commits
+            return FakeResponse(page_json, gzipped=page % 2 == 0)
+
+        self.urlopen.side_effect = urlopen
+        return requested_urls
+
+    def test_get_commits(self) -> None:
+        requested_urls = self.fake_compare_api(250)
+        commits = self.retriever.get_commits('base', 'head')
+        self.assertEqual(
+            [
+                f'https://api.github.com/compare/base...head?per_page=100&page={page}'
+                for page in (1, 2, 3)
+            ],
+            sorted(requested_urls),
+        )
+        # Commits are in order and the merge commit is skipped
+        assert commits is not None
+        self.assertEqual([str(i) for i in range(249)], [commit.hash for commit in commits])
+        self.assertEqual(
+            CommitInfo('0', 'Title 0', 'Signed-off-by: Po <po@p.o>', 'Po', 'po@p.o', False),
+            commits[0],
+        )
+
+        # The merge commit is kept if merge commits are checked
+        self.fake_compare_api(250)
+        commits = self.retriever.get_commits('base', 'head', check_merge_commits=True)
+        assert commits is not None
+        self.assertEqual(250, len(commits))
+        self.assertTrue(commits[-1].is_merge_commit)
+
+        # Only one page
+        requested_urls = self.fake_compare_api(100)
+        commits = self.retriever.get_commits('base', 'head')
+        self.assertEqual(1, len(requested_urls))
+        assert commits is not None
+        self.assertEqual(99, len(commits))
+
+    def test_get_commits_null_author(self) -> None:
+        # Null author name/email values are passed through
+        commit_json = self.get_commit_json('0')
+        commit_json['commit']['author']['email'] = None
+        self.urlopen.return_value = FakeResponse({'total_commits': 1, 'commits': [commit_json]})
+        self.assertEqual(
+            [CommitInfo('0', 'Title 0', 'Signed-off-by: Po <po@p.o>', 'Po', None, False)],
+            self.retriever.get_commits('base', 'head'),
+        )
+
+    def test_get_commits_failure(self) -> None:
+        for failed_page in (1, 2, 3):
+            with self.subTest(failed_page=failed_page):
+                self.fake_compare_api(250, failed_page)
+                with patch('sys.stdout', new=io.StringIO()):
+                    self.assertIsNone(self.retriever.get_commits('base', 'head'))
+
+        # Other errors while requesting or reading a page, including in concurrent requests
+        failures: List[Union[Exception, bytes]] = [
+            ConnectionResetError(),
+            http.client.IncompleteRead(b'{"commits": '),
+            http.client.RemoteDisconnected(),
+            b'{"commits": ',
+            b'not JSON',
+        ]
+        for failure in failures:
+            with self.subTest(failure=failure):
+                self.fake_compare_api(250, 2, failure)
+                with patch('sys.stdout', new=io.StringIO()) as fake_stdout:
+                    self.assertIsNone(self.retriever.get_commits('base', 'head'))
+                    self.assertIn('Request failed', fake_stdout.getvalue())
+
+    def test_get_commits_without_total_commits(self) -> None:
+        # Only the first page is used if the total number of commits is missing
+        requested_urls = self.fake_compare_api(250, include_total_commits=False)
+        commits = self.retriever.get_commits('base', 'head')
+        self.assertEqual(1, len(requested_urls))
+        assert commits is not None
+        self.assertEqual(100, len(commits))
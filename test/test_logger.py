@@ -17,36 +17,36 @@ from io import StringIO
 import unittest
 from unittest.mock import patch
 
-from dco_check.dco_check import get_parser
 from dco_check.dco_check import Logger
 from dco_check.dco_check import Options
 
 
-class TestLogger(unittest.TestCase):
+# Args that do not enable quiet or verbose, to be used as a template
+DEFAULT_ARGS = {
+    'check_merge_commits': False,
+    'default_branch': 'b',
+    'default_branch_from_remote': False,
+    'default_remote': 'c',
+    'exclude_emails': None,
+    'exclude_pattern': None,
+    'quiet': False,
+    'verbose': False,
+}
+
 
-    def __init__(self, *args) -> None:
-        super().__init__(
-            *args,
-        )
+class TestLogger(unittest.TestCase):
 
     def test_logger(self) -> None:
-        ns = argparse.Namespace(
-            check_merge_commits=False,
-            default_branch='b',
-            default_branch_from_remote=False,
-            default_remote='c',
-            exclude_emails=None,
-            exclude_pattern=None,
-            quiet=False,
-            verbose=False,
-        )
-        options = Options(get_parser())
+        ns = argparse.Namespace(**DEFAULT_ARGS)
+        options = Options()
         options.set_options(ns)
 
-        l = Logger(get_parser())
+        l = Logger()
         l.set_options(options)
 
         # Not quiet, not verbose
+        self.assertFalse(l.is_quiet())
+        self.assertFalse(l.is_verbose())
         with patch('sys.stdout', new=StringIO()) as fake_stdout:
             l.print('abcdef')
             self.assertEqual('abcdef', fake_stdout.getvalue().strip())
@@ -55,35 +55,19 @@ class TestLogger(unittest.TestCase):
             self.assertEqual('', fake_stdout.getvalue().strip())
 
         # Verbose
-        ns = argparse.Namespace(
-            check_merge_commits=False,
-            default_branch='b',
-            default_branch_from_remote=False,
-            default_remote='c',
-            exclude_emails=None,
-            exclude_pattern=None,
-            quiet=False,
-            verbose=True,
-        )
+        ns = argparse.Namespace(**{**DEFAULT_ARGS, 'verbose': True})
         options.set_options(ns)
         l.set_options(options)
+        self.assertTrue(l.is_verbose())
         with patch('sys.stdout', new=StringIO()) as fake_stdout:
             l.verbose_print('123456')
             self.assertEqual('123456', fake_stdout.getvalue().strip())
 
         # Quiet
-        ns = argparse.Namespace(
-            check_merge_commits=False,
-            default_branch='b',
-            default_branch_from_remote=False,
-            default_remote='c',
-            exclude_emails=None,
-            exclude_pattern=None,
-            quiet=True,
-            verbose=False,
-        )
+        ns = argparse.Namespace(**{**DEFAULT_ARGS, 'quiet': True})
         options.set_options(ns)
         l.set_options(options)
+        self.assertTrue(l.is_quiet())
         with patch('sys.stdout', new=StringIO()) as fake_stdout:
             l.print('abcdef')
             self.assertEqual('', fake_stdout.getvalue().strip())
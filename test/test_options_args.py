@@ -16,21 +16,18 @@ import argparse
 import os
 import re
 import sys
+from typing import Any
+from typing import Dict
 import unittest
 from unittest.mock import patch
 
-from dco_check.dco_check import get_parser
+from dco_check.dco_check import DEFAULT_OPTIONS
 from dco_check.dco_check import Options
 from dco_check.dco_check import parse_args
 
 
 class TestOptionsArgs(unittest.TestCase):
 
-    def __init__(self, *args) -> None:
-        super().__init__(
-            *args,
-        )
-
     def test_parse_args(self) -> None:
         # To simply test the call itself
         test_argv = ['dco_check/dco_check.py', '-v', '-b', 'my-default-branch']
@@ -45,8 +42,14 @@ class TestOptionsArgs(unittest.TestCase):
             self.assertEqual(True, args.quiet)
             self.assertEqual('myawesomeremote', args.default_remote)
 
+    def test_options_default(self) -> None:
+        # The parser and the options use the same default values
+        with self.patch_environment({}):
+            self.assertDictEqual(DEFAULT_OPTIONS, vars(parse_args([])))
+        self.assertDictEqual(DEFAULT_OPTIONS, Options().get_options())
+
     def test_options_basic(self) -> None:
-        options = Options(get_parser())
+        options = Options()
         ns = argparse.Namespace(
             check_merge_commits=True,
             default_branch='b',
@@ -77,117 +80,113 @@ class TestOptionsArgs(unittest.TestCase):
         )
 
     @staticmethod
-    def reset_environment() -> None:
-        env_vars = [
-            'DCO_CHECK_CHECK_MERGE_COMMITS',
-            'DCO_CHECK_DEFAULT_BRANCH',
-            'DCO_CHECK_DEFAULT_BRANCH_FROM_REMOTE',
-            'DCO_CHECK_DEFAULT_REMOTE',
-            'DCO_CHECK_EXCLUDE_EMAILS',
-            'DCO_CHECK_EXCLUDE_PATTERN',
-            'DCO_CHECK_QUIET',
-            'DCO_CHECK_VERBOSE',
-        ]
-        for env_var in env_vars:
-            if env_var in os.environ:
-                del os.environ[env_var]
+    def patch_environment(env_vars: Dict[str, str]) -> Any:
+        # Only keep the given DCO_CHECK_* env vars and restore the environment afterwards
+        environ = {k: v for k, v in os.environ.items() if not k.startswith('DCO_CHECK_')}
+        return patch.dict(os.environ, {**environ, **env_vars}, clear=True)
+
+    def assert_options(self, expected: Dict[str, Any], options: Options) -> None:
+        for name, value in expected.items():
+            self.assertEqual(value, getattr(options, name), name)
 
     def test_args_default(self) -> None:
-        # Set options through env vars
-        self.reset_environment()
-        os.environ['DCO_CHECK_CHECK_MERGE_COMMITS'] = 'yessss'
-        os.environ['DCO_CHECK_DEFAULT_BRANCH'] = 'adefaultbranch'
-        os.environ['DCO_CHECK_DEFAULT_REMOTE'] = 'adefaultremote'
-        os.environ['DCO_CHECK_EXCLUDE_EMAILS'] = 'email@gmail.com,other@gmail.com'
-        os.environ['DCO_CHECK_EXCLUDE_PATTERN'] = '\\[bot\\]@gmail\\.com'
-        os.environ['DCO_CHECK_QUIET'] = 'True'
-        # os.environ['DCO_CHECK_VERBOSE'] = 'False'
-        test_argv = ['dco_check/dco_check.py']
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            options.set_options(args)
-            self.assertEqual(True, options.check_merge_commits)
-            self.assertEqual('adefaultbranch', options.default_branch)
-            self.assertEqual('adefaultremote', options.default_remote)
-            self.assertEqual(['email@gmail.com', 'other@gmail.com'], options.exclude_emails)
-            self.assertEqual(re.compile('\\[bot\\]@gmail\\.com'), options.exclude_pattern)
-            self.assertEqual(True, options.quiet)
-            self.assertEqual(False, options.verbose)
-
-        # Set options through env vars but use some non-default args which should override
-        self.reset_environment()
-        os.environ['DCO_CHECK_CHECK_MERGE_COMMITS'] = 'yessss'
-        os.environ['DCO_CHECK_DEFAULT_BRANCH'] = 'adefaultbranch'
-        os.environ['DCO_CHECK_DEFAULT_REMOTE'] = 'adefaultremote'
-        os.environ['DCO_CHECK_EXCLUDE_EMAILS'] = 'email@gmail.com,other@gmail.com'
-        os.environ['DCO_CHECK_EXCLUDE_PATTERN'] = '\\[bot\\]@gmail\\.com'
-        os.environ['DCO_CHECK_QUIET'] = 'True'
-        # os.environ['DCO_CHECK_VERBOSE'] = 'False'
-        test_argv = [
-            'dco_check/dco_check.py',
-            '--check-merge-commits',  # Same value
-            '--default-remote',
-            'someremote',
-            '--exclude-emails',
-            'some@gmail.com',
+        env_vars = {
+            'DCO_CHECK_CHECK_MERGE_COMMITS': 'yessss',
+            'DCO_CHECK_DEFAULT_BRANCH': 'adefaultbranch',
+            'DCO_CHECK_DEFAULT_REMOTE': 'adefaultremote',
+            'DCO_CHECK_EXCLUDE_EMAILS': 'email@gmail.com,other@gmail.com',
+            'DCO_CHECK_EXCLUDE_PATTERN': '\\[bot\\]@gmail\\.com',
+            'DCO_CHECK_QUIET': 'True',
+            # 'DCO_CHECK_VERBOSE': 'False',
+        }
+        scenarios = [
+            (
+                'set options through env vars',
+                ['dco_check/dco_check.py'],
+                {
+                    'check_merge_commits': True,
+                    'default_branch': 'adefaultbranch',
+                    'default_remote': 'adefaultremote',
+                    'exclude_emails': ['email@gmail.com', 'other@gmail.com'],
+                    'exclude_pattern': re.compile('\\[bot\\]@gmail\\.com'),
+                    'quiet': True,
+                    'verbose': False,
+                },
+            ),
+            (
+                'set options through env vars but override some with non-default args',
+                [
+                    'dco_check/dco_check.py',
+                    '--check-merge-commits',  # Same value
+                    '--default-remote',
+                    'someremote',
+                    '--exclude-emails',
+                    'some@gmail.com',
+                ],
+                {
+                    'check_merge_commits': True,
+                    'default_branch': 'adefaultbranch',
+                    'default_remote': 'someremote',
+                    'exclude_emails': ['some@gmail.com'],
+                    'quiet': True,
+                    'verbose': False,
+                },
+            ),
         ]
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            options.set_options(args)
-            self.assertEqual(True, options.check_merge_commits)
-            self.assertEqual('adefaultbranch', options.default_branch)
-            self.assertEqual('someremote', options.default_remote)
-            self.assertEqual(['some@gmail.com'], options.exclude_emails)
-            self.assertEqual(True, options.quiet)
-            self.assertEqual(False, options.verbose)
+        options = Options()
+        for name, test_argv, expected in scenarios:
+            with self.subTest(name), self.patch_environment(env_vars):
+                with patch.object(sys, 'argv', test_argv):
+                    options.set_options(parse_args())
+                    self.assert_options(expected, options)
 
         # Exits if both quiet and verbose are enabled
-        self.reset_environment()
-        os.environ['DCO_CHECK_QUIET'] = 'True'
-        # os.environ['DCO_CHECK_VERBOSE'] = 'False'
-        test_argv = [
-            'dco_check/dco_check.py',
-            '--verbose',
-        ]
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            with self.assertRaises(SystemExit):
-                options.set_options(args)
-
-        self.reset_environment()
-        os.environ['DCO_CHECK_QUIET'] = ''
-        os.environ['DCO_CHECK_VERBOSE'] = 'anything means True, even empty'
-        test_argv = ['dco_check/dco_check.py']
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            with self.assertRaises(SystemExit):
-                options.set_options(args)
+        with self.patch_environment({
+            'DCO_CHECK_QUIET': 'True',
+            # 'DCO_CHECK_VERBOSE': 'False',
+        }):
+            test_argv = [
+                'dco_check/dco_check.py',
+                '--verbose',
+            ]
+            with patch.object(sys, 'argv', test_argv):
+                args = parse_args()
+                options = Options()
+                with self.assertRaises(SystemExit):
+                    options.set_options(args)
+
+        with self.patch_environment({
+            'DCO_CHECK_QUIET': '',
+            'DCO_CHECK_VERBOSE': 'anything means True, even empty',
+        }):
+            test_argv = ['dco_check/dco_check.py']
+            with patch.object(sys, 'argv', test_argv):
+                args = parse_args()
+                options = Options()
+                with self.assertRaises(SystemExit):
+                    options.set_options(args)
 
         # Exits if both --default-branch and --default-branch-from-remote are set to non-default
-        self.reset_environment()
-        os.environ['DCO_CHECK_DEFAULT_BRANCH'] = 'will evaluate to True'
-        test_argv = [
-            'dco_check/dco_check.py',
-            '--default-branch-from-remote',
-        ]
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            with self.assertRaises(SystemExit):
-                options.set_options(args)
-
-        self.reset_environment()
-        os.environ['DCO_CHECK_DEFAULT_BRANCH'] = '69'
-        os.environ['DCO_CHECK_DEFAULT_BRANCH_FROM_REMOTE'] = '42'
-        test_argv = ['dco_check/dco_check.py']
-        with patch.object(sys, 'argv', test_argv):
-            args = parse_args()
-            options = Options(get_parser())
-            with self.assertRaises(SystemExit):
-                options.set_options(args)
-
-        self.reset_environment()
+        with self.patch_environment({
+            'DCO_CHECK_DEFAULT_BRANCH': 'will evaluate to True',
+        }):
+            test_argv = [
+                'dco_check/dco_check.py',
+                '--default-branch-from-remote',
+            ]
+            with patch.object(sys, 'argv', test_argv):
+                args = parse_args()
+                options = Options()
+                with self.assertRaises(SystemExit):
+                    options.set_options(args)
+
+        with self.patch_environment({
+            'DCO_CHECK_DEFAULT_BRANCH': '69',
+            'DCO_CHECK_DEFAULT_BRANCH_FROM_REMOTE': '42',
+        }):
+            test_argv = ['dco_check/dco_check.py']
+            with patch.object(sys, 'argv', test_argv):
+                args = parse_args()
+                options = Options()
+                with self.assertRaises(SystemExit):
+                    options.set_options(args)
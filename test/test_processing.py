@@ -13,159 +13,263 @@
 # limitations under the License.
 
 import argparse
-import copy
 import unittest
+from unittest.mock import patch
 
+from dco_check.dco_check import check_commit
 from dco_check.dco_check import check_infractions
 from dco_check.dco_check import CommitInfo
-from dco_check.dco_check import options
+from dco_check.dco_check import Options
 from dco_check.dco_check import process_commits
 
 
-class TestProcessing(unittest.TestCase):
-
-    def __init__(self, *args) -> None:
-        super().__init__(
-            *args,
-        )
-
-    def test_check_infractions(self) -> None:
-        self.assertEqual(0, check_infractions({}))
-        self.assertEqual(1, check_infractions({'abcd': ['some', 'errors']}))
-        self.assertEqual(1, check_infractions({'abcd': []}))
+TINKY_SIGNED = CommitInfo(
+    'adc',
+    'This is a commit title',
+    (
+        'some description about the commit\n'
+        'Signed-off-by: Tinky Winky <tinky@winky.com>'
+    ),
+    'Tinky Winky',
+    'tinky@winky.com',
+    False,
+)
+TINKY_NOT_SIGNED = CommitInfo(
+    'adc',
+    'This is a commit title',
+    '',
+    'Tinky Winky',
+    'tinky@winky.com',
+    False,
+)
+TINKY_MERGE_NOT_SIGNED = CommitInfo(
+    'adc',
+    'This is a merge commit title',
+    '',
+    'Tinky Winky',
+    'tinky@winky.com',
+    True,
+)
+LAA_SIGNED = CommitInfo(
+    'def',
+    'This is another commit title',
+    'Signed-off-by: Laa-Laa <laa@laa.laa>',
+    'Laa-Laa',
+    'laa@laa.laa',
+    False,
+)
+LAA_NOT_SIGNED = CommitInfo(
+    'adc',
+    'This is a commit title',
+    '',
+    'Laa-Laa',
+    'laa@laa.laa',
+    False,
+)
 
-    def test_process_commits(self) -> None:
-        # No commits
-        commits = []
-        self.assertEqual(0, len(process_commits(commits, False)))
-        # Signed-off comits
-        commits = [
+# Name, commits to process, whether to check merge commits, and expected number of infractions
+PROCESS_COMMITS_CASES = [
+    ('no commits', [], False, 0),
+    ('signed-off commits', [TINKY_SIGNED, LAA_SIGNED], False, 0),
+    ('ignored unsigned merge commit', [TINKY_MERGE_NOT_SIGNED, LAA_SIGNED], False, 0),
+    ('checked unsigned merge commit', [TINKY_MERGE_NOT_SIGNED, LAA_SIGNED], True, 1),
+    (
+        'invalid author name/email',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                [
-                    'some description about the commit',
-                    'Signed-off-by: Tinky Winky <tinky@winky.com>',
-                ],
-                'Tinky Winky',
-                'tinky@winky.com',
+                'Signed-off-by: Tinky Winky <tinky@winky.com>',
+                None,
+                None,
                 False,
             ),
+        ],
+        False,
+        1,
+    ),
+    ('no sign-off', [TINKY_NOT_SIGNED], False, 1),
+    (
+        'no sign-off in body',
+        [
+            TINKY_NOT_SIGNED._replace(
+                body='some description about the commit\nmentioning Signed-off-by: in passing',
+            ),
+        ],
+        False,
+        1,
+    ),
+    (
+        'sign-off email differs from author email only by case',
+        [
             CommitInfo(
-                'def',
-                'This is another commit title',
-                ['Signed-off-by: Laa-Laa <laa@laa.laa>'],
-                'Laa-Laa',
-                'laa@laa.laa',
+                'adc',
+                'This is a commit title',
+                'Signed-off-by: Tinky Winky <tinky@winky.com>',
+                'Tinky Winky',
+                'Tinky@Winky.com',
                 False,
-            )
-        ]
-        self.assertEqual(0, len(process_commits(commits, False)))
-        # Merge commit that isn't signed-off but is ignored
-        commits = [
+            ),
+        ],
+        False,
+        0,
+    ),
+    (
+        'text after sign-off email',
+        [
             CommitInfo(
                 'adc',
-                'This is a merge commit title',
-                [''],
+                'This is a commit title',
+                'Signed-off-by: Tinky Winky <tinky@winky.com> # for the docs',
                 'Tinky Winky',
                 'tinky@winky.com',
-                True,
+                False,
             ),
+        ],
+        False,
+        0,
+    ),
+    (
+        'multiple sign-offs including the author',
+        [
             CommitInfo(
-                'def',
-                'This is another commit title',
-                ['Signed-off-by: Laa-Laa <laa@laa.laa>'],
-                'Laa-Laa',
-                'laa@laa.laa',
+                'adc',
+                'This is a commit title',
+                (
+                    'Signed-off-by: Laa-Laa <laa@laa.laa>\n'
+                    'Signed-off-by: Tinky Winky <tinky@winky.com>'
+                ),
+                'Tinky Winky',
+                'tinky@winky.com',
                 False,
-            )
-        ]
-        self.assertEqual(0, len(process_commits(commits, False)))
-        # Merge commit that isn't signed-off but is NOT ignored
-        commits = [
+            ),
+        ],
+        False,
+        0,
+    ),
+    (
+        'blank line between sign-offs',
+        [
             CommitInfo(
                 'adc',
-                'This is a merge commit title',
-                [''],
+                'This is a commit title',
+                (
+                    'Signed-off-by: Laa-Laa <laa@laa.laa>\n'
+                    '\n'
+                    'Signed-off-by: Tinky Winky <tinky@winky.com>\n'
+                ),
                 'Tinky Winky',
                 'tinky@winky.com',
-                True,
+                False,
             ),
+        ],
+        False,
+        0,
+    ),
+    (
+        'CRLF line endings',
+        [
             CommitInfo(
-                'def',
-                'This is another commit title',
-                ['Signed-off-by: Laa-Laa <laa@laa.laa>'],
-                'Laa-Laa',
-                'laa@laa.laa',
+                'adc',
+                'This is a commit title',
+                (
+                    'some description about the commit\r\n'
+                    '\r\n'
+                    'Signed-off-by: Tinky Winky <tinky@winky.com>\r\n'
+                ),
+                'Tinky Winky',
+                'tinky@winky.com',
                 False,
-            )
-        ]
-        self.assertEqual(1, len(process_commits(commits, True)))
-        # Invalid author name/email
-        commits = [
+            ),
+        ],
+        False,
+        0,
+    ),
+    (
+        'trailing whitespace after sign-off',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: Tinky Winky <tinky@winky.com>'],
-                None,
-                None,
+                'Signed-off-by: Tinky Winky <tinky@winky.com> \t',
+                'Tinky Winky',
+                'tinky@winky.com',
                 False,
             ),
-        ]
-        self.assertEqual(1, len(process_commits(commits, False)))
-        # No sign-off
-        commits = [
+        ],
+        False,
+        0,
+    ),
+    (
+        'bare sign-off',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                [''],
+                'Signed-off-by:',
                 'Tinky Winky',
                 'tinky@winky.com',
                 False,
             ),
-        ]
-        self.assertEqual(1, len(process_commits(commits, False)))
-        commits = [
+        ],
+        False,
+        1,
+    ),
+    (
+        'bare sign-off followed by sign-off',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                [],
+                (
+                    'Signed-off-by:\n'
+                    'Signed-off-by: Tinky Winky <tinky@winky.com>'
+                ),
                 'Tinky Winky',
                 'tinky@winky.com',
                 False,
             ),
-        ]
-        self.assertEqual(1, len(process_commits(commits, False)))
-        # Invalid sign-off email
-        commits = [
+        ],
+        False,
+        0,
+    ),
+    (
+        'invalid sign-off email',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: Tinky Winky <winky.com>'],
+                'Signed-off-by: Tinky Winky <winky.com>',
                 'Tinky Winky',
                 'tinky@winky.com',
                 False,
             ),
-        ]
-        self.assertEqual(1, len(process_commits(commits, False)))
-        # Sign-off doesn't match author
-        commits = [
+        ],
+        False,
+        1,
+    ),
+    (
+        'sign-off does not match author',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: Tinky Winky <winky.com>'],
+                'Signed-off-by: Tinky Winky <winky.com>',
                 'Laa-Laa',
                 'laa@laa.laa',
                 False,
             ),
-        ]
-        self.assertEqual(1, len(process_commits(commits, False)))
-        # Multiple failures
-        commits = [
+        ],
+        False,
+        1,
+    ),
+    (
+        'multiple failures',
+        [
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: Tinky Winky <winky.com>'],
+                'Signed-off-by: Tinky Winky <winky.com>',
                 'Laa-Laa',
                 'laa@laa.laa',
                 False,
@@ -173,26 +277,69 @@ class TestProcessing(unittest.TestCase):
             CommitInfo(
                 'def',
                 'This is a commit title',
-                ['Signed-off-by: Tinky Winky <winky.com>'],
+                'Signed-off-by: Tinky Winky <winky.com>',
                 'Tinky Winky',
                 'tinky@winky.com',
                 False,
             ),
-            CommitInfo(
-                'ghi',
-                'This is a merge commit title',
-                [],
-                'Tinky Winky',
-                'tinky@winky.com',
-                True,
-            ),
-        ]
-        self.assertEqual(3, len(process_commits(commits, True)))
+            TINKY_MERGE_NOT_SIGNED._replace(hash='ghi'),
+        ],
+        True,
+        3,
+    ),
+]
 
-    def test_process_commits_exclude_email(self) -> None:
-        global options
-        original_options = copy.copy(options)
 
+class TestProcessing(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Let tests set options without affecting the global options used by other tests
+        patcher = patch('dco_check.dco_check.options', Options())
+        self.options = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_commit_info(self) -> None:
+        # The hash is given as commit_hash but accessed as hash
+        commit = CommitInfo(
+            commit_hash='adc',
+            title='This is a commit title',
+            body='',
+            author_name='Tinky Winky',
+            author_email='tinky@winky.com',
+        )
+        self.assertEqual(TINKY_NOT_SIGNED, commit)
+        self.assertEqual('adc', commit.hash)
+        self.assertFalse(commit.is_merge_commit)
+
+    def test_check_infractions(self) -> None:
+        self.assertEqual(0, check_infractions({}))
+        self.assertEqual(1, check_infractions({'abcd': ['some', 'errors']}))
+        self.assertEqual(1, check_infractions({'abcd': []}))
+
+    def test_process_commits(self) -> None:
+        for name, commits, check_merge_commits, expected in PROCESS_COMMITS_CASES:
+            with self.subTest(name):
+                self.assertEqual(expected, len(process_commits(commits, check_merge_commits)))
+
+    def test_check_commit_sign_off_whitespace(self) -> None:
+        # Trailing whitespace and carriage returns are not part of the extracted sign-offs
+        commit = CommitInfo(
+            'adc',
+            'This is a commit title',
+            'Signed-off-by: Laa-Laa <laa@laa.laa> \r\nSigned-off-by: Po <po@p.o>\r\n',
+            'Tinky Winky',
+            'tinky@winky.com',
+            False,
+        )
+        self.assertEqual(
+            [
+                'sign-off not found for commit author: Tinky Winky tinky@winky.com; '
+                "found: ['Laa-Laa <laa@laa.laa>', 'Po <po@p.o>']",
+            ],
+            check_commit(commit, False),
+        )
+
+    def test_process_commits_exclude_email(self) -> None:
         ns = argparse.Namespace(
             check_merge_commits=True,
             default_branch='b',
@@ -203,35 +350,19 @@ class TestProcessing(unittest.TestCase):
             quiet=False,
             verbose=False,
         )
-        options.set_options(ns)
+        self.options.set_options(ns)
 
         # No sign-off but author email is in exclude emails list
-        commits = [
-            CommitInfo(
-                'adc',
-                'This is a commit title',
-                [],
-                'Laa-Laa',
-                'laa@laa.laa',
-                False,
-            ),
-        ]
+        commits = [LAA_NOT_SIGNED]
         self.assertEqual(0, len(process_commits(commits, False)))
 
         # No sign-offs but one commit has its author email is in exclude emails list
         commits = [
-            CommitInfo(
-                'adc',
-                'This is a commit title',
-                [],
-                'Laa-Laa',
-                'laa@laa.laa',
-                False,
-            ),
+            LAA_NOT_SIGNED,
             CommitInfo(
                 'def',
                 'This is another commit title',
-                [],
+                '',
                 'Po',
                 'po@p.o',
                 False,
@@ -244,7 +375,7 @@ class TestProcessing(unittest.TestCase):
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: Laa-Laa <laa@laa.laa>'],
+                'Signed-off-by: Laa-Laa <laa@laa.laa>',
                 'Laa-Laa',
                 'laa@laa.laa',
                 False,
@@ -257,12 +388,10 @@ class TestProcessing(unittest.TestCase):
             CommitInfo(
                 'adc',
                 'This is a commit title',
-                ['Signed-off-by: genericbot <[bot]@gmail.com>'],
+                'Signed-off-by: genericbot <[bot]@gmail.com>',
                 'generic_bot',
                 '277373_gen[bot]@gmail.com',
                 False,
             ),
         ]
         self.assertEqual(0, len(process_commits(commits, False)))
-
-        options = original_options
@@ -23,11 +23,6 @@ from dco_check.dco_check import split_commits_data
 
 class TestUtils(unittest.TestCase):
 
-    def __init__(self, *args) -> None:
-        super().__init__(
-            *args,
-        )
-
     def test_is_valid_email(self) -> None:
         self.assertTrue(is_valid_email('abc@def.hij'))
         self.assertFalse(is_valid_email('@def.hij'))
@@ -37,6 +32,8 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(is_valid_email('abc@'))
         self.assertFalse(is_valid_email(''))
         self.assertFalse(is_valid_email('@'))
+        self.assertFalse(is_valid_email('abc@def@hij.klm'))
+        self.assertFalse(is_valid_email('abc@def.hij klm'))
 
     def test_extract_name_and_email(self) -> None:
         self.assertEqual(
@@ -48,11 +45,23 @@ class TestUtils(unittest.TestCase):
             ('Po', 'po'),
             extract_name_and_email('Po <po>'),
         )
+        # It tolerates extra whitespace
+        self.assertEqual(
+            ('Laa-Laa', 'laa@laa.laa'),
+            extract_name_and_email('  Laa-Laa  <laa@laa.laa> '),
+        )
+        # It ignores any text after the email
+        self.assertEqual(
+            ('Dipsy', 'dipsy@dip.sy'),
+            extract_name_and_email('Dipsy <dipsy@dip.sy> # for the docs'),
+        )
         self.assertIsNone(extract_name_and_email(''))
         self.assertIsNone(extract_name_and_email('a <'))
         self.assertIsNone(extract_name_and_email('a >'))
         self.assertIsNone(extract_name_and_email('<>'))
         self.assertIsNone(extract_name_and_email('<abc>'))
+        # The name and the email must be separated by a space
+        self.assertIsNone(extract_name_and_email('Laa-Laa<laa@laa.laa>'))
 
     def test_get_env_var(self) -> None:
         self.assertIsNone(get_env_var(''))
@@ -68,6 +77,8 @@ class TestUtils(unittest.TestCase):
         )
         self.assertEqual('', get_env_var('THIS_PROBABLY_DOES_NOT_EXIST', default=''))
 
+        # Changes to the environment are taken into account right away
+        self.assertIsNone(get_env_var('THIS_WILL_EXIST'))
         os.environ['THIS_WILL_EXIST'] = 'xyz'
         self.assertEqual('xyz', get_env_var('THIS_WILL_EXIST'))
         self.assertEqual('xyz', get_env_var('THIS_WILL_EXIST', default='abc'))
@@ -87,3 +98,18 @@ class TestUtils(unittest.TestCase):
             '\x1e'
         )
         self.assertEqual(['abc', 'def'], split_commits_data(data))
+        # Empty elements are filtered out
+        data = (
+            'abc'
+            '\x1e'
+            '\x1e'
+            'def'
+        )
+        self.assertEqual(['abc', 'def'], split_commits_data(data))
+        data = (
+            '\n'
+            '\x1e'
+            'abc'
+        )
+        self.assertEqual(['abc'], split_commits_data(data))
+        self.assertEqual([], split_commits_data(''))